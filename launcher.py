@@ -4,6 +4,7 @@ Psion-inspired Launcher for Raspberry Pi
 A retro grid-based application launcher using Tkinter
 """
 
+import os
 import sys
 import json
 import subprocess
@@ -13,19 +14,521 @@ import tkinter as tk
 from tkinter import messagebox
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 import psutil
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # Optional: SVG icons fall back to rsvg-convert, then to bitmaps only
+    cairosvg = None
 import threading
+import logging
+from logging.handlers import RotatingFileHandler
+import tempfile
+import shutil
+import ctypes
+import ctypes.util
+import fcntl
+import hashlib
+import select
+import traceback
+import mmap
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import argparse
+import tracemalloc
+import heapq
+import signal
 import time
 import math
 from datetime import datetime
 
 
+SHARED_METRICS_PATH = '/dev/shm/psion-launcher-metrics'
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'psion-launcher'
+
+
+def format_rate(bytes_per_sec):
+    """Format a byte rate for compact display"""
+    if bytes_per_sec >= 1024 * 1024:
+        return f"{bytes_per_sec / (1024 * 1024):.1f}MB/s"
+    if bytes_per_sec >= 1024:
+        return f"{bytes_per_sec / 1024:.0f}KB/s"
+    return f"{bytes_per_sec:.0f}B/s"
+
+
+class StorageMonitor:
+    """Block device I/O and mount capacity collector"""
+    
+    DISKSTATS_PATH = '/proc/diskstats'
+    SYS_BLOCK_PATH = '/sys/block'
+    SECTOR_SIZE = 512
+    IGNORED_PREFIXES = ('loop', 'ram', 'zram')
+    
+    def __init__(self, mounts=None, capacity_interval=60):
+        self.mounts = mounts or ['/']
+        self.capacity_interval = capacity_interval
+        self.lock = threading.Lock()
+        
+        # Latest computed values, guarded by self.lock
+        self.devices = {}
+        self.capacity = {}
+        
+        self.last_counters = None
+        self.last_time = None
+        self.last_capacity_time = None
+    
+    def read_diskstats(self):
+        """Read raw counters for whole block devices from /proc/diskstats"""
+        try:
+            disks = set(os.listdir(self.SYS_BLOCK_PATH))
+        except OSError:
+            disks = None
+        
+        counters = {}
+        with open(self.DISKSTATS_PATH, 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 14:
+                    continue
+                name = fields[2]
+                if name.startswith(self.IGNORED_PREFIXES):
+                    continue
+                # Skip partitions so activity is not counted twice
+                if disks is not None and name not in disks:
+                    continue
+                counters[name] = (
+                    int(fields[3]),   # reads completed
+                    int(fields[5]),   # sectors read
+                    int(fields[7]),   # writes completed
+                    int(fields[9]),   # sectors written
+                    int(fields[12]),  # ms spent doing I/O
+                )
+        return counters
+    
+    def read_capacity(self):
+        """Read capacity of configured mounts via statvfs"""
+        capacity = {}
+        for mount in self.mounts:
+            try:
+                st = os.statvfs(mount)
+            except OSError:
+                continue
+            total = st.f_blocks * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+            used = total - st.f_bfree * st.f_frsize
+            # Match df: percentage of space available to unprivileged users
+            usable = used + free
+            percent = (used / usable) * 100 if usable else 0.0
+            capacity[mount] = {
+                'total': total,
+                'used': used,
+                'free': free,
+                'percent': percent
+            }
+        return capacity
+    
+    def sample(self):
+        """Take one sample and update per-device rates"""
+        now = time.monotonic()
+        counters = self.read_diskstats()
+        
+        devices = {}
+        if self.last_counters is not None:
+            time_delta = now - self.last_time
+            if time_delta > 0:
+                for name, current in counters.items():
+                    previous = self.last_counters.get(name)
+                    if previous is None:
+                        continue
+                    reads, sectors_read, writes, sectors_written, io_ms = (
+                        c - p for c, p in zip(current, previous)
+                    )
+                    devices[name] = {
+                        'read_bytes': sectors_read * self.SECTOR_SIZE / time_delta,
+                        'write_bytes': sectors_written * self.SECTOR_SIZE / time_delta,
+                        'iops': (reads + writes) / time_delta,
+                        'util': min(100.0, io_ms / (time_delta * 1000) * 100)
+                    }
+        
+        self.last_counters = counters
+        self.last_time = now
+        
+        # Capacity changes slowly, so sample it far less often
+        capacity = None
+        if (self.last_capacity_time is None or
+                now - self.last_capacity_time >= self.capacity_interval):
+            capacity = self.read_capacity()
+            self.last_capacity_time = now
+        
+        with self.lock:
+            self.devices = devices
+            if capacity is not None:
+                self.capacity = capacity
+    
+    def busiest(self):
+        """Return (name, stats) for the most utilised device, or None"""
+        with self.lock:
+            if not self.devices:
+                return None
+            return max(self.devices.items(),
+                       key=lambda item: (item[1]['util'], item[1]['iops']))
+    
+    def snapshot(self):
+        """Return copies of the latest device and capacity stats"""
+        with self.lock:
+            return dict(self.devices), dict(self.capacity)
+
+    def load(self, devices, capacity):
+        """Replace the latest stats with values sampled elsewhere"""
+        with self.lock:
+            self.devices = devices
+            self.capacity = capacity
+
+
+class MetricsSampler:
+    """Samples CPU, RAM, storage, network and WiFi metrics in-process"""
+    
+    def __init__(self, storage_monitor=None, interface='wlan0'):
+        self.storage_monitor = storage_monitor or StorageMonitor()
+        self.interface = interface
+        self.last_net_io = self.read_net_io()
+        self.last_time = time.time()
+    
+    def read_net_io(self):
+        """Return network counters for the WiFi interface, or all interfaces"""
+        return psutil.net_io_counters(pernic=True).get(self.interface, psutil.net_io_counters())
+    
+    def read_wifi(self):
+        """Return WiFi link quality percent, or None if it cannot be parsed"""
+        try:
+            wifi_info = subprocess.run(
+                f"iwconfig {self.interface} 2>/dev/null | grep 'Link Quality'",
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=1
+            )
+            if wifi_info.returncode == 0 and wifi_info.stdout:
+                # Extract signal quality
+                quality_match = re.search(r'Link Quality=(\d+)/(\d+)', wifi_info.stdout)
+                if quality_match:
+                    quality = int(quality_match.group(1))
+                    max_quality = int(quality_match.group(2))
+                    return int((quality / max_quality) * 100)
+                return None
+            return 0
+        except:
+            return 0
+    
+    def sample(self):
+        """Take one sample of every metric shown in the status bar"""
+        # CPU usage
+        cpu_percent = psutil.cpu_percent(interval=0.5)
+        
+        # RAM usage
+        ram = psutil.virtual_memory()
+        
+        # Storage I/O
+        try:
+            self.storage_monitor.sample()
+        except OSError as e:
+            print(f"Error sampling storage: {e}")
+        devices, capacity = self.storage_monitor.snapshot()
+        
+        # Network speed
+        current_net_io = self.read_net_io()
+        current_time = time.time()
+        time_delta = current_time - self.last_time
+        net_up = net_down = 0.0
+        if time_delta > 0:
+            net_up = (current_net_io.bytes_sent - self.last_net_io.bytes_sent) / time_delta
+            net_down = (current_net_io.bytes_recv - self.last_net_io.bytes_recv) / time_delta
+        self.last_net_io = current_net_io
+        self.last_time = current_time
+        
+        return {
+            'cpu': cpu_percent,
+            'ram': ram.percent,
+            'net_up': net_up,
+            'net_down': net_down,
+            'wifi': self.read_wifi(),
+            'devices': devices,
+            'capacity': capacity
+        }
+
+
+class SharedMetrics:
+    """Fixed-layout metrics record in a memory-mapped file, guarded by a seqlock
+    
+    The producer bumps the sequence number to an odd value, writes the record,
+    then bumps it to an even value. Readers retry until they see the same even
+    sequence number before and after copying the fields out.
+    """
+    
+    MAGIC = b'PSLM'
+    VERSION = 1
+    MAX_DEVICES = 8
+    MAX_MOUNTS = 4
+    
+    HEADER = struct.Struct('<4sHH')      # magic, version, reserved
+    SEQ = struct.Struct('<I')            # sequence number
+    BODY = struct.Struct('<dddddiII')    # timestamp, cpu, ram, net_up, net_down,
+                                         # wifi, device count, mount count
+    DEVICE = struct.Struct('<16sdddd')   # name, read, write, iops, util
+    MOUNT = struct.Struct('<64sQQQd')    # mount, total, used, free, percent
+    
+    SEQ_OFFSET = HEADER.size
+    BODY_OFFSET = SEQ_OFFSET + SEQ.size
+    DEVICES_OFFSET = BODY_OFFSET + BODY.size
+    MOUNTS_OFFSET = DEVICES_OFFSET + DEVICE.size * MAX_DEVICES
+    SIZE = MOUNTS_OFFSET + MOUNT.size * MAX_MOUNTS
+    
+    NO_WIFI = -1
+    READ_RETRIES = 100
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self.buffer = None
+        self.lock_fd = None
+        self.seq = 0
+    
+    def create(self):
+        """Map the record for writing, creating it if needed (producer side)
+        
+        Holds an exclusive lock on the file until close(): two producers would
+        each keep their own sequence number and readers would accept torn records.
+        """
+        # Never unlink or shrink the file: readers keep their mappings
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(f"Another metrics producer is already publishing to {self.path}")
+        try:
+            os.ftruncate(fd, self.SIZE)
+            self.buffer = mmap.mmap(fd, self.SIZE)
+        except OSError:
+            os.close(fd)
+            raise
+        self.lock_fd = fd
+        self.seq = self.SEQ.unpack_from(self.buffer, self.SEQ_OFFSET)[0] & ~1
+        self.HEADER.pack_into(self.buffer, 0, self.MAGIC, self.VERSION, 0)
+    
+    def attach(self):
+        """Map an existing record read-only; return False if there is none"""
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            if os.fstat(fd).st_size < self.SIZE:
+                return False
+            buffer = mmap.mmap(fd, self.SIZE, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        magic, version, _ = self.HEADER.unpack_from(buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            buffer.close()
+            return False
+        self.buffer = buffer
+        return True
+    
+    def close(self):
+        """Unmap the record and release the producer lock, if held"""
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+        if self.lock_fd is not None:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+    
+    @staticmethod
+    def encode_name(name, size):
+        """Encode a name for a fixed-size field, truncating on a UTF-8 boundary"""
+        encoded = name.encode()
+        if len(encoded) > size:
+            encoded = encoded[:size].decode(errors='ignore').encode()
+        return encoded
+    
+    @classmethod
+    def self_check(cls):
+        """Publish a record to a temporary file and read it back; raise on mismatch"""
+        long_mount = '/media/' + 'é' * 40
+        metrics = {
+            'cpu': 12.5,
+            'ram': 40.0,
+            'net_up': 1024.0,
+            'net_down': 2048.0,
+            'wifi': None,
+            'devices': {'mmcblk0': {'read_bytes': 512.0, 'write_bytes': 4096.0,
+                                    'iops': 3.0, 'util': 7.5}},
+            'capacity': {long_mount: {'total': 1000, 'used': 400, 'free': 600,
+                                      'percent': 40.0}}
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = cls(os.path.join(tmp, 'metrics'))
+            writer.create()
+            writer.publish(metrics)
+            reader = cls(writer.path)
+            result = reader.read(stale_after=60)
+            reader.close()
+            writer.close()
+        
+        expected = dict(metrics)
+        expected['capacity'] = {
+            cls.encode_name(long_mount, 64).decode(): metrics['capacity'][long_mount]
+        }
+        if result != expected:
+            raise RuntimeError(f"Shared metrics round trip mismatch:\n{result}\n!=\n{expected}")
+    
+    def publish(self, metrics):
+        """Write one metrics record (producer side)"""
+        devices = sorted(metrics['devices'].items(),
+                         key=lambda item: item[1]['util'], reverse=True)[:self.MAX_DEVICES]
+        capacity = list(metrics['capacity'].items())[:self.MAX_MOUNTS]
+        wifi = self.NO_WIFI if metrics['wifi'] is None else metrics['wifi']
+        
+        self.seq += 1
+        self.SEQ.pack_into(self.buffer, self.SEQ_OFFSET, self.seq)
+        
+        self.BODY.pack_into(
+            self.buffer, self.BODY_OFFSET,
+            time.monotonic(), metrics['cpu'], metrics['ram'],
+            metrics['net_up'], metrics['net_down'], wifi,
+            len(devices), len(capacity)
+        )
+        for i, (name, stats) in enumerate(devices):
+            self.DEVICE.pack_into(
+                self.buffer, self.DEVICES_OFFSET + i * self.DEVICE.size,
+                self.encode_name(name, 16), stats['read_bytes'], stats['write_bytes'],
+                stats['iops'], stats['util']
+            )
+        for i, (mount, usage) in enumerate(capacity):
+            self.MOUNT.pack_into(
+                self.buffer, self.MOUNTS_OFFSET + i * self.MOUNT.size,
+                self.encode_name(mount, 64), usage['total'], usage['used'],
+                usage['free'], usage['percent']
+            )
+        
+        self.seq += 1
+        self.SEQ.pack_into(self.buffer, self.SEQ_OFFSET, self.seq)
+    
+    def read(self, stale_after):
+        """Return the latest metrics, or None if the producer is absent or stale"""
+        if self.buffer is None and not self.attach():
+            return None
+        
+        result = self.read_record(stale_after)
+        if result is None:
+            # The file may have been removed and recreated (e.g. logind RemoveIPC),
+            # leaving this mapping on the old inode; map it afresh next time
+            self.close()
+        return result
+    
+    def read_record(self, stale_after):
+        """Copy the record out of the mapping, or None if it is bad, stale or busy"""
+        magic, version, _ = self.HEADER.unpack_from(self.buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+        
+        for _ in range(self.READ_RETRIES):
+            before = self.SEQ.unpack_from(self.buffer, self.SEQ_OFFSET)[0]
+            if before & 1:
+                # Producer is mid-write
+                time.sleep(0)
+                continue
+            
+            timestamp, cpu, ram, net_up, net_down, wifi, device_count, mount_count = (
+                self.BODY.unpack_from(self.buffer, self.BODY_OFFSET)
+            )
+            devices = {}
+            for i in range(min(device_count, self.MAX_DEVICES)):
+                name, read_bytes, write_bytes, iops, util = self.DEVICE.unpack_from(
+                    self.buffer, self.DEVICES_OFFSET + i * self.DEVICE.size)
+                devices[name.rstrip(b'\0').decode(errors='replace')] = {
+                    'read_bytes': read_bytes,
+                    'write_bytes': write_bytes,
+                    'iops': iops,
+                    'util': util
+                }
+            capacity = {}
+            for i in range(min(mount_count, self.MAX_MOUNTS)):
+                mount, total, used, free, percent = self.MOUNT.unpack_from(
+                    self.buffer, self.MOUNTS_OFFSET + i * self.MOUNT.size)
+                capacity[mount.rstrip(b'\0').decode(errors='replace')] = {
+                    'total': total,
+                    'used': used,
+                    'free': free,
+                    'percent': percent
+                }
+            
+            if self.SEQ.unpack_from(self.buffer, self.SEQ_OFFSET)[0] != before:
+                # Torn read, try again
+                continue
+            
+            # CLOCK_MONOTONIC is system-wide, so producer timestamps compare directly
+            if before == 0 or time.monotonic() - timestamp > stale_after:
+                return None
+            return {
+                'cpu': cpu,
+                'ram': ram,
+                'net_up': net_up,
+                'net_down': net_down,
+                'wifi': None if wifi == self.NO_WIFI else wifi,
+                'devices': devices,
+                'capacity': capacity
+            }
+        return None
+
+
+class MetricsProducer:
+    """Standalone process that samples metrics once for every launcher instance"""
+    
+    def __init__(self, config):
+        metrics_config = config.get('metrics', {})
+        storage_config = config.get('storage', {})
+        self.interval = metrics_config.get('interval', 1.0)
+        self.shared = SharedMetrics(metrics_config.get('shared_path', SHARED_METRICS_PATH))
+        self.sampler = MetricsSampler(StorageMonitor(
+            mounts=storage_config.get('mounts', ['/']),
+            capacity_interval=storage_config.get('capacity_interval', 60)
+        ))
+        self.running = True
+    
+    def run(self):
+        """Sample and publish until stopped"""
+        SharedMetrics.self_check()
+        self.shared.create()
+        print(f"Publishing metrics to {self.shared.path}")
+        try:
+            while self.running:
+                started = time.monotonic()
+                try:
+                    self.shared.publish(self.sampler.sample())
+                except Exception as e:
+                    print(f"Error publishing metrics: {e}")
+                time.sleep(max(0, self.interval - (time.monotonic() - started)))
+        finally:
+            self.shared.close()
+    
+    def stop(self):
+        """Stop the publish loop"""
+        self.running = False
+
+
 class StatusBar(tk.Frame):
     """Status bar showing system metrics"""
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, storage_monitor=None, shared_metrics=None, stale_after=5, **kwargs):
         super().__init__(parent, **kwargs)
         self.configure(bg='#1E1E1E', height=36)
         self.pack_propagate(False)
+        self.storage_monitor = storage_monitor or StorageMonitor()
+        self.shared_metrics = shared_metrics
+        self.stale_after = stale_after
+        self.sampler = None
+        self.interval = 2
         
         # Container for metrics
         metrics_frame = tk.Frame(self, bg='#2C2C2C')
@@ -34,7 +537,7 @@ class StatusBar(tk.Frame):
         # Create metric labels
         self.cpu_label = self.create_metric_label(metrics_frame, "CPU: --")
         self.ram_label = self.create_metric_label(metrics_frame, "RAM: --")
-        self.disk_label = self.create_metric_label(metrics_frame, "SSD: --")
+        self.disk_label = self.create_metric_label(metrics_frame, "I/O: --")
         self.net_label = self.create_metric_label(metrics_frame, "NET: --")
         self.wifi_label = self.create_metric_label(metrics_frame, "WiFi: --")
         
@@ -57,93 +560,204 @@ class StatusBar(tk.Frame):
         label.pack(side=tk.LEFT)
         return label
     
+    def read_metrics(self):
+        """Read from the metrics producer, falling back to in-process sampling"""
+        if self.shared_metrics:
+            try:
+                metrics = self.shared_metrics.read(self.stale_after)
+            except Exception as e:
+                print(f"Error reading shared metrics: {e}")
+                metrics = None
+            if metrics:
+                # Keep the System window's storage details current
+                self.storage_monitor.load(metrics['devices'], metrics['capacity'])
+                return metrics
+        
+        if self.sampler is None:
+            self.sampler = MetricsSampler(self.storage_monitor)
+        return self.sampler.sample()
+    
     def update_metrics(self):
         """Update system metrics periodically"""
-        last_net_io = psutil.net_io_counters(pernic=True).get('wlan0', psutil.net_io_counters())
-        last_time = time.time()
-        
         while self.running:
             try:
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=0.5)
-                self.cpu_label.config(text=f"CPU: {cpu_percent:.0f}%")
-                
-                # RAM usage
-                ram = psutil.virtual_memory()
-                self.ram_label.config(text=f"RAM: {ram.percent:.0f}%")
+                metrics = self.read_metrics()
                 
-                # Disk usage
-                disk = psutil.disk_usage('/')
-                self.disk_label.config(text=f"SSD: {disk.percent:.0f}%")
+                self.cpu_label.config(text=f"CPU: {metrics['cpu']:.0f}%")
+                self.ram_label.config(text=f"RAM: {metrics['ram']:.0f}%")
                 
-                # Network speed
-                current_net_io = psutil.net_io_counters(pernic=True).get('wlan0', psutil.net_io_counters())
-                current_time = time.time()
-                time_delta = current_time - last_time
+                # Storage I/O - show the busiest block device
+                busiest = self.storage_monitor.busiest()
+                if busiest:
+                    name, stats = busiest
+                    self.disk_label.config(text=f"I/O: {name} {stats['util']:.0f}%")
+                else:
+                    self.disk_label.config(text="I/O: --")
                 
-                if time_delta > 0:
-                    bytes_sent = current_net_io.bytes_sent - last_net_io.bytes_sent
-                    bytes_recv = current_net_io.bytes_recv - last_net_io.bytes_recv
-                    
-                    # Calculate speed in KB/s
-                    upload_speed = (bytes_sent / time_delta) / 1024
-                    download_speed = (bytes_recv / time_delta) / 1024
-                    
-                    # Format based on magnitude
-                    if download_speed > 1024:
-                        net_text = f"NET: ↓{download_speed/1024:.1f}MB/s"
-                    elif download_speed > 1:
-                        net_text = f"NET: ↓{download_speed:.0f}KB/s"
-                    else:
-                        net_text = "NET: --"
-                    
-                    self.net_label.config(text=net_text)
+                # Network speed - format based on magnitude
+                download_speed = metrics['net_down'] / 1024
+                if download_speed > 1024:
+                    net_text = f"NET: ↓{download_speed/1024:.1f}MB/s"
+                elif download_speed > 1:
+                    net_text = f"NET: ↓{download_speed:.0f}KB/s"
+                else:
+                    net_text = "NET: --"
+                self.net_label.config(text=net_text)
                 
                 # WiFi status
-                try:
-                    wifi_info = subprocess.run(
-                        "iwconfig wlan0 2>/dev/null | grep 'Link Quality'",
-                        shell=True,
-                        capture_output=True,
-                        text=True,
-                        timeout=1
-                    )
-                    if wifi_info.returncode == 0 and wifi_info.stdout:
-                        # Extract signal quality
-                        quality_match = re.search(r'Link Quality=(\d+)/(\d+)', wifi_info.stdout)
-                        if quality_match:
-                            quality = int(quality_match.group(1))
-                            max_quality = int(quality_match.group(2))
-                            percent = int((quality / max_quality) * 100)
-                            self.wifi_label.config(text=f"WiFi: {percent}%")
-                        else:
-                            self.wifi_label.config(text="WiFi: --")
-                    else:
-                        self.wifi_label.config(text="WiFi: 0%")
-                except:
-                    self.wifi_label.config(text="WiFi: 0%")
-                
-                last_net_io = current_net_io
-                last_time = current_time
+                if metrics['wifi'] is None:
+                    self.wifi_label.config(text="WiFi: --")
+                else:
+                    self.wifi_label.config(text=f"WiFi: {metrics['wifi']}%")
                 
-                time.sleep(2)  # Update every 2 seconds
+                time.sleep(self.interval)  # Update every 2 seconds by default
                 
             except Exception as e:
                 print(f"Error updating metrics: {e}")
-                time.sleep(2)
+                time.sleep(self.interval)
     
     def stop(self):
         """Stop the update thread"""
         self.running = False
 
 
+class ProcessScanner:
+    """Incremental /proc scanner for per-process CPU and memory"""
+    
+    PROC_PATH = '/proc'
+    
+    def __init__(self):
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.page_size = os.sysconf('SC_PAGE_SIZE')
+        
+        # Per-PID static data, keyed by PID and validated by start time
+        # so that a recycled PID is never mistaken for the old process
+        self.static = {}
+        self.last_ticks = {}
+        self.last_time = None
+        
+        self.processes = []
+        self.scan_seconds = 0.0
+    
+    def read_stat(self, pid):
+        """Return (comm, cpu_ticks, start_time, rss_bytes) from /proc/<pid>/stat"""
+        with open(f'{self.PROC_PATH}/{pid}/stat', 'rb') as f:
+            data = f.read()
+        
+        # comm may contain spaces and parentheses, so split on the last ')'
+        close = data.rindex(b')')
+        comm = data[data.index(b'(') + 1:close].decode(errors='replace')
+        fields = data[close + 2:].split()
+        
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_time = int(fields[19])
+        rss_bytes = int(fields[21]) * self.page_size
+        return comm, cpu_ticks, start_time, rss_bytes
+    
+    def scan(self):
+        """Re-read stat for every PID and update CPU/RSS figures"""
+        started = time.perf_counter()
+        now = time.monotonic()
+        elapsed = now - self.last_time if self.last_time is not None else 0
+        
+        ticks = {}
+        processes = []
+        for entry in os.listdir(self.PROC_PATH):
+            if not entry.isdigit():
+                continue
+            pid = int(entry)
+            try:
+                comm, cpu_ticks, start_time, rss_bytes = self.read_stat(pid)
+            except (OSError, ValueError, IndexError):
+                # Process exited between listdir and open
+                continue
+            
+            static = self.static.get(pid)
+            previous = self.last_ticks.get(pid)
+            if static is None or static['start_time'] != start_time:
+                static = {'start_time': start_time, 'cmdline': None, 'exe': None}
+                self.static[pid] = static
+                previous = None
+            
+            if previous is not None and elapsed > 0:
+                cpu = (cpu_ticks - previous) / (elapsed * self.clock_ticks) * 100
+            else:
+                cpu = 0.0
+            
+            ticks[pid] = cpu_ticks
+            processes.append({'pid': pid, 'name': comm, 'cpu': cpu, 'rss': rss_bytes,
+                              'start_time': start_time})
+        
+        # Forget processes that have exited
+        for pid in self.static.keys() - ticks.keys():
+            del self.static[pid]
+        
+        self.last_ticks = ticks
+        self.last_time = now
+        self.processes = processes
+        self.scan_seconds = time.perf_counter() - started
+    
+    def top(self, count, key='cpu'):
+        """Return the top processes ordered by 'cpu' or 'rss'"""
+        return heapq.nlargest(count, self.processes, key=lambda p: p[key])
+    
+    def start_time(self, pid):
+        """Return the current start time of a PID, or None if it has exited"""
+        try:
+            return self.read_stat(pid)[2]
+        except (OSError, ValueError, IndexError):
+            return None
+    
+    def thread_ids(self, pid):
+        """Return the IDs of every thread in a process"""
+        return [int(tid) for tid in os.listdir(f'{self.PROC_PATH}/{pid}/task') if tid.isdigit()]
+    
+    def cmdline(self, pid):
+        """Return the cached command line for a PID, reading it on first use"""
+        static = self.static.get(pid)
+        if static is None:
+            return ''
+        if static['cmdline'] is None:
+            try:
+                with open(f'{self.PROC_PATH}/{pid}/cmdline', 'rb') as f:
+                    raw = f.read()
+                static['cmdline'] = raw.replace(b'\0', b' ').decode(errors='replace').strip()
+            except OSError:
+                static['cmdline'] = ''
+        return static['cmdline']
+    
+    def exe(self, pid):
+        """Return the cached executable path for a PID, reading it on first use"""
+        static = self.static.get(pid)
+        if static is None:
+            return ''
+        if static['exe'] is None:
+            try:
+                static['exe'] = os.readlink(f'{self.PROC_PATH}/{pid}/exe')
+            except OSError:
+                # Kernel threads and other users' processes
+                static['exe'] = ''
+        return static['exe']
+
+
 class SystemInfoWindow:
     """System information window in Psion style"""
     
-    def __init__(self, parent):
+    WIDTH = 760
+    HEIGHT = 700
+    
+    def __init__(self, parent, storage_monitor=None, process_count=8, refresh_ms=1000):
+        self.storage_monitor = storage_monitor
+        self.process_count = process_count
+        self.refresh_ms = refresh_ms
+        self.sort_key = 'cpu'
+        # (pid, start_time) per row, so a recycled PID is never acted on
+        self.shown = []
+        self.scanner = ProcessScanner()
+        
         self.window = tk.Toplevel(parent)
         self.window.title("System Information")
-        self.window.geometry("600x500")
+        self.window.geometry(f"{self.WIDTH}x{self.HEIGHT}")
         self.window.resizable(False, False)
         self.window.configure(bg='#D6D9D2')
         
@@ -195,27 +809,178 @@ class SystemInfoWindow:
             fg='#2F332E',
             relief=tk.FLAT,
             wrap=tk.WORD,
+            height=14,
             padx=10,
             pady=10
         )
         self.text.pack(fill=tk.BOTH, expand=True)
         
+        # Live process panel
+        self.create_process_panel()
+        
         # Load system info
         self.load_system_info()
         
         # Make text read-only
         self.text.configure(state=tk.DISABLED)
         
+        # Prime the scanner so the first refresh has CPU deltas
+        self.scanner.scan()
+        self.refresh_job = self.window.after(self.refresh_ms, self.refresh_processes)
+        self.window.bind('<Destroy>', self.on_destroy)
+        
         # Center window
         self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (600 // 2)
-        y = (self.window.winfo_screenheight() // 2) - (500 // 2)
+        x = (self.window.winfo_screenwidth() // 2) - (self.WIDTH // 2)
+        y = (self.window.winfo_screenheight() // 2) - (self.HEIGHT // 2)
         self.window.geometry(f"+{x}+{y}")
         
         # Make window modal
         self.window.transient(parent)
         self.window.grab_set()
     
+    def create_process_panel(self):
+        """Create the top-N process list with sort, renice and kill controls"""
+        process_frame = tk.Frame(
+            self.window,
+            bg='#E2E5DE',
+            relief=tk.SUNKEN,
+            borderwidth=2
+        )
+        process_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        
+        self.process_header = tk.Label(
+            process_frame,
+            text="Processes",
+            font=('Monospace', 10, 'bold'),
+            bg='#E2E5DE',
+            fg='#2F332E',
+            anchor='w',
+            padx=10
+        )
+        self.process_header.pack(fill=tk.X, pady=(5, 0))
+        
+        self.process_list = tk.Listbox(
+            process_frame,
+            font=('Monospace', 10),
+            bg='#E2E5DE',
+            fg='#2F332E',
+            selectbackground='#4A90E2',
+            selectforeground='white',
+            relief=tk.FLAT,
+            height=self.process_count,
+            activestyle='none',
+            exportselection=False
+        )
+        self.process_list.pack(fill=tk.X, padx=10, pady=5)
+        
+        button_frame = tk.Frame(process_frame, bg='#E2E5DE')
+        button_frame.pack(fill=tk.X, padx=10, pady=(0, 5))
+        
+        self.sort_button = self.create_panel_button(button_frame, "Sort: CPU", self.toggle_sort)
+        self.create_panel_button(button_frame, "Kill", self.kill_selected)
+        self.create_panel_button(button_frame, "Nice +5", self.renice_selected)
+    
+    def create_panel_button(self, parent, text, command):
+        """Create a styled process panel button"""
+        button = tk.Button(
+            parent,
+            text=text,
+            font=('Monospace', 9, 'bold'),
+            bg='#D6D9D2',
+            fg='#2F332E',
+            relief=tk.RAISED,
+            borderwidth=2,
+            command=command,
+            activebackground='#C8CBC4'
+        )
+        button.pack(side=tk.LEFT, padx=(0, 8))
+        return button
+    
+    def refresh_processes(self):
+        """Rescan /proc and redraw the process list"""
+        try:
+            self.scanner.scan()
+        except OSError as e:
+            print(f"Error scanning processes: {e}")
+        
+        selected = self.selected_pid()
+        top = self.scanner.top(self.process_count, key=self.sort_key)
+        self.shown = [(p['pid'], p['start_time']) for p in top]
+        
+        self.process_list.delete(0, tk.END)
+        for proc in top:
+            command = self.scanner.cmdline(proc['pid']) or f"[{proc['name']}]"
+            self.process_list.insert(
+                tk.END,
+                f"{proc['pid']:>7} {proc['cpu']:5.1f}% {proc['rss'] / (1024 * 1024):7.1f}M  {command[:60]}"
+            )
+            if proc['pid'] == selected:
+                self.process_list.selection_set(tk.END)
+        
+        sort_name = 'CPU' if self.sort_key == 'cpu' else 'RSS'
+        self.process_header.config(
+            text=f"Processes - top {self.process_count} by {sort_name}  "
+                 f"(scan {self.scanner.scan_seconds * 1000:.1f}ms)"
+        )
+        
+        self.refresh_job = self.window.after(self.refresh_ms, self.refresh_processes)
+    
+    def selected_pid(self):
+        """Return the PID of the selected row, or None"""
+        return self.selected_process()[0]
+    
+    def selected_process(self):
+        """Return (pid, start_time) of the selected row, or (None, None)"""
+        selection = self.process_list.curselection()
+        if not selection or selection[0] >= len(self.shown):
+            return None, None
+        return self.shown[selection[0]]
+    
+    def toggle_sort(self):
+        """Switch between CPU and RSS ordering"""
+        self.sort_key = 'rss' if self.sort_key == 'cpu' else 'cpu'
+        self.sort_button.config(text=f"Sort: {'CPU' if self.sort_key == 'cpu' else 'RSS'}")
+    
+    def kill_selected(self):
+        """Send SIGTERM to the selected process after confirmation"""
+        pid, start_time = self.selected_process()
+        if pid is None:
+            return
+        command = self.scanner.exe(pid) or self.scanner.cmdline(pid) or str(pid)
+        if not messagebox.askyesno("Confirm", f"Kill process {pid}?\n{command}", parent=self.window):
+            return
+        # The process may have exited and its PID been reused while the dialog was open
+        if self.scanner.start_time(pid) != start_time:
+            messagebox.showerror("Kill Error", f"Process {pid} has already exited", parent=self.window)
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError as e:
+            messagebox.showerror("Kill Error", f"Failed to kill {pid}:\n{str(e)}", parent=self.window)
+    
+    def renice_selected(self):
+        """Lower the priority of the selected process by 5"""
+        pid = self.selected_pid()
+        if pid is None:
+            return
+        try:
+            # On Linux nice is per thread, so renice every thread of the process
+            for tid in self.scanner.thread_ids(pid):
+                try:
+                    niceness = os.getpriority(os.PRIO_PROCESS, tid)
+                    os.setpriority(os.PRIO_PROCESS, tid, min(19, niceness + 5))
+                except ProcessLookupError:
+                    # Thread exited since the task list was read
+                    continue
+        except OSError as e:
+            messagebox.showerror("Renice Error", f"Failed to renice {pid}:\n{str(e)}", parent=self.window)
+    
+    def on_destroy(self, event):
+        """Stop refreshing once the window is closed"""
+        if event.widget is self.window:
+            self.window.after_cancel(self.refresh_job)
+    
     def load_system_info(self):
         """Load and display system information"""
         self.text.configure(state=tk.NORMAL)
@@ -267,16 +1032,57 @@ class SystemInfoWindow:
         except:
             pass
         
+        if self.storage_monitor:
+            self.load_storage_info()
+        
         self.text.configure(state=tk.DISABLED)
+    
+    def load_storage_info(self):
+        """Append per-device I/O and mount capacity from the storage monitor"""
+        devices, capacity = self.storage_monitor.snapshot()
+        
+        self.text.insert(tk.END, "\n" + "─" * 60 + "\n\n")
+        self.text.insert(tk.END, "Storage I/O:\n")
+        if devices:
+            for name, stats in sorted(devices.items()):
+                self.text.insert(
+                    tk.END,
+                    f"  • {name:10s} R {format_rate(stats['read_bytes']):>9s}  "
+                    f"W {format_rate(stats['write_bytes']):>9s}  "
+                    f"{stats['iops']:5.0f} IOPS  {stats['util']:3.0f}%\n"
+                )
+        else:
+            self.text.insert(tk.END, "  • N/A\n")
+        
+        self.text.insert(tk.END, "\nCapacity:\n")
+        for mount, usage in capacity.items():
+            total_gb = usage['total'] / (1024 ** 3)
+            free_gb = usage['free'] / (1024 ** 3)
+            self.text.insert(
+                tk.END,
+                f"  • {mount:10s} {usage['percent']:3.0f}% used  "
+                f"{free_gb:.1f}G free of {total_gb:.1f}G\n"
+            )
 
 
 class LauncherButton(tk.Frame):
     """Custom button widget for launcher items"""
     
-    def __init__(self, parent, app_data, wide=False, **kwargs):
+    # Shared by all buttons so launches never fork on the Tk thread
+    launch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='launch')
+    # Window-manager tweaks are slow and must not hold up launches
+    fullscreen_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fullscreen')
+    FRAME_SECONDS = 1 / 60
+    
+    # Offset between our monotonic clock and X server event times, used
+    # when the server clock is not CLOCK_MONOTONIC
+    event_clock_offset = None
+    
+    def __init__(self, parent, app_data, wide=False, launcher=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.app_data = app_data
         self.wide = wide
+        self.launcher = launcher
         self.parent_root = parent.winfo_toplevel()
         
         # Configure frame - optimized for full screen
@@ -353,37 +1159,71 @@ class LauncherButton(tk.Frame):
         icon_path = self.app_data.get('icon', '')
         icon_size = (130, 130) if not self.wide else (60, 60)
         
+        # Icon names (e.g. 'firefox' from a .desktop file) go through the icon theme.
+        # That can walk the theme or run rsvg-convert, so show the letter tile now
+        # and swap the icon in once the resolver thread has it.
+        if icon_path and not Path(icon_path).exists() and '/' not in icon_path and self.launcher:
+            self.set_icon(self.letter_icon(icon_size))
+            future = self.launcher.icon_resolver.executor.submit(
+                self.open_icon, icon_path, icon_size)
+            future.add_done_callback(
+                lambda f: self.parent_root.after(0, self.icon_resolved, f))
+            return
+        
         try:
             if icon_path and Path(icon_path).exists():
                 img = Image.open(icon_path)
                 img = img.resize(icon_size, Image.LANCZOS)
             else:
-                # Create colored icon with letter
-                img = Image.new('RGB', icon_size, self.app_data.get('color', '#4A90E2'))
-                draw = ImageDraw.Draw(img)
-                
-                # Try to use a font, fallback to default
-                font_size = 80 if not self.wide else 40
-                try:
-                    font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf', font_size)
-                except:
-                    font = ImageFont.load_default()
-                
-                # Draw letter
-                letter = self.app_data['name'][0].upper()
-                bbox = draw.textbbox((0, 0), letter, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                position = ((icon_size[0] - text_width) // 2, (icon_size[1] - text_height) // 2 - 5)
-                draw.text(position, letter, fill='white', font=font)
-            
-            # Convert to PhotoImage
-            self.photo = ImageTk.PhotoImage(img)
-            self.icon_label.configure(image=self.photo)
+                img = self.letter_icon(icon_size)
+            self.set_icon(img)
             
         except Exception as e:
             print(f"Error loading icon for {self.app_data['name']}: {e}")
     
+    def letter_icon(self, icon_size):
+        """Create a colored icon with the app's first letter"""
+        img = Image.new('RGB', icon_size, self.app_data.get('color', '#4A90E2'))
+        draw = ImageDraw.Draw(img)
+        
+        # Try to use a font, fallback to default
+        font_size = 80 if not self.wide else 40
+        try:
+            font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf', font_size)
+        except:
+            font = ImageFont.load_default()
+        
+        # Draw letter
+        letter = self.app_data['name'][0].upper()
+        bbox = draw.textbbox((0, 0), letter, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        position = ((icon_size[0] - text_width) // 2, (icon_size[1] - text_height) // 2 - 5)
+        draw.text(position, letter, fill='white', font=font)
+        return img
+    
+    def open_icon(self, icon_name, icon_size):
+        """Resolve a theme icon name and load it (runs on the icon resolver thread)"""
+        icon_path = self.launcher.icon_resolver.resolve(icon_name, icon_size[0])
+        if not icon_path:
+            return None
+        img = Image.open(icon_path)
+        return img.resize(icon_size, Image.LANCZOS)
+    
+    def icon_resolved(self, future):
+        """Swap in a resolved theme icon (runs on the Tk thread)"""
+        error = future.exception()
+        if error:
+            print(f"Error loading icon for {self.app_data['name']}: {error}")
+        elif future.result() is not None and self.winfo_exists():
+            self.set_icon(future.result())
+    
+    def set_icon(self, img):
+        """Show a PIL image in the icon label"""
+        # Convert to PhotoImage
+        self.photo = ImageTk.PhotoImage(img)
+        self.icon_label.configure(image=self.photo)
+    
     def on_enter(self, event):
         """Handle mouse enter"""
         hover_bg = '#D6D9D2'
@@ -404,7 +1244,10 @@ class LauncherButton(tk.Frame):
     
     def on_click(self, event):
         """Handle click event"""
-        # Visual feedback
+        clicked = time.perf_counter()
+        queue_delay = self.event_delay(event)
+        
+        # Visual feedback - painted before any launch work so it always shows
         click_bg = '#C8CBC4'
         self.configure(bg=click_bg)
         self.icon_label.configure(bg=click_bg)
@@ -412,37 +1255,89 @@ class LauncherButton(tk.Frame):
         if hasattr(self, 'content_container'):
             self.content_container.configure(bg=click_bg)
         self.after(100, lambda: self.on_leave(None))
+        self.update_idletasks()
+        
+        # Click-to-feedback: time queued before this handler ran plus time to paint
+        latency = queue_delay + time.perf_counter() - clicked
+        if self.launcher:
+            self.launcher.click_latencies.append(latency)
+        if latency > self.FRAME_SECONDS:
+            print(f"Slow click feedback for {self.app_data['name']}: {latency * 1000:.1f}ms")
         
         # Launch app
         self.launch_app()
     
+    def event_delay(self, event):
+        """Return seconds between the X server stamping the click and now"""
+        if event is None or not getattr(event, 'time', 0):
+            # Simulated click
+            return 0.0
+        
+        # Xorg stamps events with CLOCK_MONOTONIC milliseconds, wrapping at 32 bits
+        now_ms = int(time.monotonic() * 1000)
+        delay_ms = (now_ms - event.time) & 0xFFFFFFFF
+        if delay_ms > 10000:
+            # Different server clock: the smallest offset seen is the no-delay baseline
+            offset = now_ms - event.time
+            cls = LauncherButton
+            if cls.event_clock_offset is None or offset < cls.event_clock_offset:
+                cls.event_clock_offset = offset
+            delay_ms = offset - cls.event_clock_offset
+        return delay_ms / 1000
+    
     def launch_app(self):
         """Launch the application"""
         app_type = self.app_data.get('type', 'exec')
+        dry_run = bool(self.launcher and self.launcher.dry_run)
         
-        try:
-            if app_type == 'exec':
-                command = self.app_data['command']
-                # If command is a script ending in .sh, launch in new terminal
-                if command.endswith('.sh'):
-                    # Launch in new terminal window
-                    subprocess.Popen(['x-terminal-emulator', '-e', command])
-                else:
-                    subprocess.Popen(command, shell=True)
-            elif app_type == 'url':
-                subprocess.Popen(['xdg-open', self.app_data['command']])
-            elif app_type == 'terminal':
-                self.launch_terminal()
-            elif app_type == 'system':
-                self.handle_system_command()
-            elif app_type == 'system_info':
-                self.show_system_info()
-        except Exception as e:
+        # Windows and dialogs must stay on the Tk thread
+        if app_type == 'system_info':
+            self.show_system_info()
+            return
+        if app_type == 'system' and not dry_run and not self.confirm_system_command():
+            return
+        
+        # Fork/exec can stall on a loaded Pi, so spawn on the launch executor
+        self.text_label.configure(text="Launching…")
+        future = self.launch_executor.submit(self.spawn, app_type, dry_run)
+        future.add_done_callback(
+            lambda f: self.parent_root.after(0, self.launch_finished, f, app_type, dry_run))
+    
+    def spawn(self, app_type, dry_run):
+        """Start the application process (runs on the launch executor)"""
+        if dry_run:
+            # Exercise the spawn path without starting real applications
+            subprocess.Popen(['true'])
+        elif app_type == 'exec':
+            command = self.app_data['command']
+            # If command is a script ending in .sh, launch in new terminal
+            if command.endswith('.sh'):
+                # Launch in new terminal window
+                subprocess.Popen(['x-terminal-emulator', '-e', command])
+            else:
+                subprocess.Popen(command, shell=True)
+        elif app_type == 'url':
+            subprocess.Popen(['xdg-open', self.app_data['command']])
+        elif app_type == 'terminal':
+            self.launch_terminal()
+        elif app_type == 'system':
+            subprocess.Popen(self.app_data['command'], shell=True)
+    
+    def launch_finished(self, future, app_type, dry_run):
+        """Restore the label and report launch errors (runs on the Tk thread)"""
+        # The grid may have been rebuilt while the launch was in flight
+        if self.winfo_exists():
+            self.text_label.configure(text=self.app_data['name'])
+        error = future.exception()
+        if error:
             messagebox.showerror("Launch Error", 
-                               f"Failed to launch {self.app_data['name']}:\n{str(e)}")
+                               f"Failed to launch {self.app_data['name']}:\n{str(error)}")
+        elif app_type == 'terminal' and not dry_run:
+            # Give the terminal time to open, then fullscreen it off the Tk thread
+            self.parent_root.after(500, lambda: self.fullscreen_executor.submit(self.make_fullscreen))
     
     def launch_terminal(self):
-        """Launch command in a fullscreen terminal"""
+        """Launch command in a terminal; launch_finished then makes it fullscreen"""
         command = self.app_data.get('command', '')
         
         # Launch terminal with the command
@@ -451,45 +1346,49 @@ class LauncherButton(tk.Frame):
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL
         )
-        
-        # Try to make the terminal fullscreen using wmctrl (common on Raspberry Pi OS)
-        def make_fullscreen():
-            time.sleep(0.5)  # Wait for terminal to open
+    
+    def make_fullscreen(self):
+        """Try to make the terminal fullscreen (runs on the fullscreen executor)"""
+        # Try wmctrl first (common on Raspberry Pi OS)
+        try:
+            # Find the terminal window and make it fullscreen
+            subprocess.run(
+                ['wmctrl', '-r', ':ACTIVE:', '-b', 'add,fullscreen'],
+                timeout=1,
+                capture_output=True
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+            # wmctrl not available or failed, try alternative method
             try:
-                # Find the terminal window and make it fullscreen
+                # Try using xdotool as fallback
                 subprocess.run(
-                    ['wmctrl', '-r', ':ACTIVE:', '-b', 'add,fullscreen'],
+                    ['xdotool', 'search', '--class', 'x-terminal-emulator', 'windowactivate', '--sync', 'key', 'F11'],
                     timeout=1,
                     capture_output=True
                 )
             except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                # wmctrl not available or failed, try alternative method
-                try:
-                    # Try using xdotool as fallback
-                    subprocess.run(
-                        ['xdotool', 'search', '--class', 'x-terminal-emulator', 'windowactivate', '--sync', 'key', 'F11'],
-                        timeout=1,
-                        capture_output=True
-                    )
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-                    # If both fail, terminal will open normally (not fullscreen)
-                    pass
-        
-        # Run fullscreen attempt in background thread
-        threading.Thread(target=make_fullscreen, daemon=True).start()
+                # If both fail, terminal will open normally (not fullscreen)
+                pass
     
-    def handle_system_command(self):
-        """Handle system commands like shutdown/restart"""
-        result = messagebox.askyesno(
+    def confirm_system_command(self):
+        """Confirm system commands like shutdown/restart"""
+        return messagebox.askyesno(
             "Confirm",
             f"Are you sure you want to {self.app_data['name']}?"
         )
-        if result:
-            subprocess.Popen(self.app_data['command'], shell=True)
     
     def show_system_info(self):
         """Show system information window"""
-        SystemInfoWindow(self.parent_root)
+        if self.launcher:
+            process_config = self.launcher.config.get('processes', {})
+            SystemInfoWindow(
+                self.parent_root,
+                storage_monitor=self.launcher.storage_monitor,
+                process_count=process_config.get('count', 8),
+                refresh_ms=process_config.get('refresh_ms', 1000)
+            )
+        else:
+            SystemInfoWindow(self.parent_root)
 
 
 class AnalogueClock(tk.Canvas):
@@ -502,6 +1401,7 @@ class AnalogueClock(tk.Canvas):
         self.size = size
         self.center = size // 2
         self.radius = size // 2 - 15
+        self.interval = 1.0
         
         self.running = True
         self.update_clock()
@@ -514,7 +1414,7 @@ class AnalogueClock(tk.Canvas):
         """Update clock every second"""
         while self.running:
             self.after(0, self.update_clock)
-            time.sleep(1)
+            time.sleep(self.interval)
     
     def update_clock(self):
         """Draw the clock face and hands"""
@@ -599,13 +1499,755 @@ class AnalogueClock(tk.Canvas):
         self.running = False
 
 
+class LagMonitor:
+    """Tk event-loop latency watchdog that captures the main thread's stack on stalls"""
+    
+    # Upper bounds of histogram buckets in milliseconds; the last bucket is open-ended
+    BUCKETS_MS = (16, 50, 100, 250, 500, 1000)
+    
+    def __init__(self, root, interval_ms=100, threshold_ms=250, log_path='lag.log',
+                 overlay=False, report_interval=60, log_max_bytes=1024 * 1024, log_backups=2):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold = threshold_ms / 1000
+        self.report_interval = report_interval
+        self.log_path = CACHE_DIR / log_path
+        self.main_thread_id = threading.main_thread().ident
+        
+        self.histogram = [0] * (len(self.BUCKETS_MS) + 1)
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.last_stack = None
+        self.stalled = False
+        self.beats = 0
+        
+        # Bounded log for launchers that run for weeks; raises OSError if unwritable
+        self.log_lock = threading.Lock()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_handler = RotatingFileHandler(
+            self.log_path, maxBytes=log_max_bytes, backupCount=log_backups
+        )
+        self.log_handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        self.logger = logging.getLogger('psion-launcher.lag')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.log_handler)
+        self.running = True
+        
+        self.overlay = None
+        if overlay:
+            self.overlay = tk.Label(
+                root,
+                text="LAG: --",
+                font=('Monospace', 9),
+                bg='#1E1E1E',
+                fg='#F1C40F',
+                justify=tk.LEFT,
+                anchor='w',
+                padx=6
+            )
+            self.overlay.place(relx=0, rely=1, anchor='sw')
+        
+        now = time.monotonic()
+        self.last_beat = now
+        self.expected = now + interval_ms / 1000
+        self.last_report = now
+        self.root.after(interval_ms, self.beat)
+        
+        self.watchdog_thread = threading.Thread(target=self.watchdog, daemon=True)
+        self.watchdog_thread.start()
+    
+    def log(self, text):
+        """Append a timestamped entry to the lag log"""
+        # The watchdog may still be logging a stall while stop() closes the log
+        with self.log_lock:
+            if self.log_handler is None:
+                return
+            self.logger.info(text)
+    
+    def beat(self):
+        """Heartbeat callback - measures how late the event loop ran it"""
+        now = time.monotonic()
+        lag = max(0.0, now - self.expected)
+        self.last_beat = now
+        
+        lag_ms = lag * 1000
+        bucket = next((i for i, bound in enumerate(self.BUCKETS_MS) if lag_ms < bound),
+                      len(self.BUCKETS_MS))
+        self.histogram[bucket] += 1
+        self.max_lag = max(self.max_lag, lag)
+        
+        if self.stalled:
+            self.stalled = False
+            self.log(f"STALL ended after {lag_ms:.0f}ms")
+        
+        if now - self.last_report >= self.report_interval:
+            self.log(f"HISTOGRAM {self.format_histogram()} max={self.max_lag * 1000:.0f}ms "
+                     f"stalls={self.stalls}")
+            self.last_report = now
+        
+        self.beats += 1
+        if self.overlay and self.beats % 10 == 0:
+            self.update_overlay()
+        
+        if self.running:
+            self.expected = now + self.interval_ms / 1000
+            self.root.after(self.interval_ms, self.beat)
+    
+    def format_histogram(self):
+        """Return the histogram as 'bucket:count' pairs"""
+        labels = [f"<{bound}ms" for bound in self.BUCKETS_MS] + [f">={self.BUCKETS_MS[-1]}ms"]
+        return " ".join(f"{label}:{count}" for label, count in zip(labels, self.histogram))
+    
+    def update_overlay(self):
+        """Show lag figures and the last stall location on screen"""
+        text = f"LAG max {self.max_lag * 1000:.0f}ms  stalls {self.stalls}"
+        if self.last_stack:
+            text += f"\nlast stall: {self.last_stack[-1].strip().splitlines()[0]}"
+        self.overlay.config(text=text)
+        self.overlay.lift()
+    
+    def watchdog(self):
+        """Background check for heartbeats that are overdue"""
+        while self.running:
+            time.sleep(self.threshold / 4)
+            overdue = time.monotonic() - self.last_beat - self.interval_ms / 1000
+            if overdue > self.threshold and not self.stalled:
+                self.stalled = True
+                self.stalls += 1
+                self.capture_stack(overdue)
+    
+    def capture_stack(self, overdue):
+        """Log the main thread's Python stack while it is blocked"""
+        if not self.running:
+            return
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return
+        self.last_stack = traceback.format_stack(frame)
+        self.log(f"STALL main loop blocked >{overdue * 1000:.0f}ms:\n" + "".join(self.last_stack))
+    
+    def stop(self):
+        """Stop the watchdog and write a final histogram"""
+        self.running = False
+        self.log(f"HISTOGRAM {self.format_histogram()} max={self.max_lag * 1000:.0f}ms "
+                 f"stalls={self.stalls}")
+        with self.log_lock:
+            self.logger.removeHandler(self.log_handler)
+            self.log_handler.close()
+            self.log_handler = None
+
+
+class Inotify:
+    """Minimal inotify wrapper using libc via ctypes"""
+    
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    
+    EVENT = struct.Struct('iIII')  # wd, mask, cookie, name length
+    
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    
+    def add_watch(self, path, mask):
+        """Watch a path; return the watch descriptor"""
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        return wd
+    
+    def read_events(self, timeout=None):
+        """Return a list of (wd, mask, name) events, waiting up to timeout seconds"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+            events.append((wd, mask, name))
+        return events
+    
+    def close(self):
+        """Close the inotify descriptor"""
+        os.close(self.fd)
+
+
+class DesktopIndex:
+    """Persistent index of .desktop files, re-parsing only files whose mtime changed"""
+    
+    DEFAULT_DIRS = (
+        str(Path.home() / '.local/share/applications'),
+        str(Path.home() / '.local/share/flatpak/exports/share/applications'),
+        '/var/lib/flatpak/exports/share/applications',
+        '/usr/local/share/applications',
+        '/usr/share/applications',
+    )
+    VERSION = 2
+    WATCH_MASK = (Inotify.IN_CLOSE_WRITE | Inotify.IN_CREATE | Inotify.IN_DELETE |
+                  Inotify.IN_MOVED_FROM | Inotify.IN_MOVED_TO | Inotify.IN_ATTRIB)
+    DEBOUNCE = 1.0
+    POLL_INTERVAL = 1.0
+    
+    # Exec field codes from the Desktop Entry spec that the launcher cannot fill in,
+    # matched together with '%%' so escapes and codes are handled in one pass
+    FIELD_CODES = re.compile(r'(\s*)%([%fFuUdDnNickvm])')
+    
+    def __init__(self, dirs=DEFAULT_DIRS):
+        # Config dirs may use '~' or be relative; os.walk() would find nothing there
+        self.dirs = [os.path.abspath(os.path.expanduser(d)) for d in dirs]
+        digest = hashlib.sha1("\n".join(self.dirs).encode()).hexdigest()[:8]
+        self.index_path = CACHE_DIR / f'desktop-index-{digest}.json'
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.inotify = None
+        self.watches = {}
+        self.running = True
+        self.load()
+    
+    def load(self):
+        """Load the persisted index, ignoring it if missing or outdated"""
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            self.entries = {}
+    
+    def save(self):
+        """Persist the index atomically"""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Error saving desktop index: {e}")
+    
+    def refresh(self):
+        """Stat every .desktop file and re-parse only new or modified ones"""
+        with self.lock:
+            entries = {}
+            parsed = 0
+            for directory in self.dirs:
+                for root, _, files in os.walk(directory):
+                    for filename in files:
+                        if not filename.endswith('.desktop'):
+                            continue
+                        path = os.path.join(root, filename)
+                        try:
+                            mtime = os.stat(path).st_mtime_ns
+                        except OSError:
+                            continue
+                        cached = self.entries.get(path)
+                        if cached and cached['mtime'] == mtime:
+                            entries[path] = cached
+                        else:
+                            entries[path] = {'mtime': mtime, **self.parse(path)}
+                            parsed += 1
+            
+            changed = parsed > 0 or entries.keys() != self.entries.keys()
+            self.entries = entries
+        if changed:
+            self.save()
+        return changed
+    
+    def expand_field_code(self, match):
+        """Replace '%%' with '%' and drop any other field code"""
+        if match.group(2) == '%':
+            return match.group(1) + '%'
+        return ''
+    
+    def parse(self, path):
+        """Parse a .desktop file into an index entry; 'app' is None if it should be hidden"""
+        fields = {}
+        in_entry = False
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('['):
+                        # Only the main group; actions come afterwards
+                        if in_entry:
+                            break
+                        in_entry = line == '[Desktop Entry]'
+                    elif in_entry and '=' in line and not line.startswith('#'):
+                        key, value = line.split('=', 1)
+                        fields[key.strip()] = value.strip()
+        except OSError:
+            return {'app': None}
+        
+        if (fields.get('Type') != 'Application' or 'Exec' not in fields or
+                fields.get('NoDisplay') == 'true' or fields.get('Hidden') == 'true'):
+            # Kept as a hidden entry so it still overrides lower-priority dirs
+            return {'app': None}
+        
+        command = self.FIELD_CODES.sub(self.expand_field_code, fields['Exec']).strip()
+        return {
+            'app': {
+                'name': fields.get('Name', Path(path).stem),
+                'type': 'terminal' if fields.get('Terminal') == 'true' else 'exec',
+                'command': command,
+                'icon': fields.get('Icon', '')
+            },
+            # Checked when listing apps, since installs change them without touching the file
+            'try_exec': fields.get('TryExec', ''),
+            'only_show_in': [d for d in fields.get('OnlyShowIn', '').split(';') if d],
+            'not_show_in': [d for d in fields.get('NotShowIn', '').split(';') if d]
+        }
+    
+    def is_visible(self, entry, desktops):
+        """Apply TryExec, OnlyShowIn and NotShowIn to an index entry"""
+        if not entry['app']:
+            return False
+        if entry['only_show_in'] and not desktops.intersection(entry['only_show_in']):
+            return False
+        if desktops.intersection(entry['not_show_in']):
+            return False
+        if entry['try_exec'] and shutil.which(entry['try_exec']) is None:
+            return False
+        return True
+    
+    def apps(self, desktops=None):
+        """Return visible apps sorted by name, earlier directories overriding later ones"""
+        if desktops is None:
+            desktops = os.environ.get('XDG_CURRENT_DESKTOP', '').split(':')
+        desktops = {d for d in desktops if d}
+        
+        with self.lock:
+            seen = {}
+            for directory in self.dirs:
+                for path, entry in self.entries.items():
+                    if not path.startswith(directory.rstrip('/') + '/'):
+                        continue
+                    # Desktop file ID is the path relative to its applications dir
+                    desktop_id = os.path.relpath(path, directory)
+                    if desktop_id not in seen:
+                        seen[desktop_id] = entry
+        apps = [entry['app'] for entry in seen.values() if self.is_visible(entry, desktops)]
+        return sorted(apps, key=lambda app: app['name'].lower())
+    
+    def in_scope(self, path):
+        """Return True if path is one of the indexed dirs or inside one"""
+        return any(path == d or path.startswith(d.rstrip('/') + '/') for d in self.dirs)
+    
+    def add_watch(self, path):
+        """Watch a directory once; return True if a new watch was added"""
+        if path in self.watches.values():
+            return False
+        try:
+            wd = self.inotify.add_watch(path, self.WATCH_MASK)
+        except OSError as e:
+            print(f"Error watching {path}: {e}")
+            return False
+        self.watches[wd] = path
+        return True
+    
+    def sync_watches(self):
+        """Watch every indexed dir and its subdirs, or the nearest parent of a missing dir
+        
+        Returns True if a watch was added inside an indexed dir, which means
+        files may have appeared there without events we saw.
+        """
+        added = False
+        for directory in self.dirs:
+            if os.path.isdir(directory):
+                for root, _, _ in os.walk(directory):
+                    added = self.add_watch(root) or added
+            else:
+                # e.g. ~/.local/share/applications on a fresh user, or the
+                # Flatpak exports dir before the first Flatpak install
+                parent = os.path.dirname(directory)
+                while not os.path.isdir(parent):
+                    if os.path.dirname(parent) == parent:
+                        break
+                    parent = os.path.dirname(parent)
+                else:
+                    self.add_watch(parent)
+        return added
+    
+    def watch(self, on_change):
+        """Keep the index updated with inotify, calling on_change after each update"""
+        try:
+            self.inotify = Inotify()
+        except (OSError, AttributeError) as e:
+            # Not Linux, or inotify unavailable
+            print(f"Desktop file watching disabled: {e}")
+            return
+        
+        self.sync_watches()
+        threading.Thread(target=self.watch_loop, args=(on_change,), daemon=True).start()
+        
+    def handle_events(self, events):
+        """Update watches for new or removed dirs; return True if the index may have changed"""
+        relevant = False
+        resync = False
+        for wd, mask, name in events:
+            if mask & Inotify.IN_Q_OVERFLOW:
+                # Events were dropped, so nothing can be assumed
+                resync = relevant = True
+                continue
+            if mask & Inotify.IN_IGNORED:
+                # Watched dir was removed; fall back to watching its parent
+                path = self.watches.pop(wd, None)
+                resync = True
+                relevant = relevant or (path is not None and self.in_scope(path))
+                continue
+            
+            parent = self.watches.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, name)
+            if mask & Inotify.IN_ISDIR:
+                if mask & (Inotify.IN_CREATE | Inotify.IN_MOVED_TO):
+                    resync = True
+                relevant = relevant or self.in_scope(path)
+            elif name.endswith('.desktop') and self.in_scope(parent):
+                relevant = True
+        
+        if resync and self.sync_watches():
+            relevant = True
+        return relevant
+    
+    def watch_loop(self, on_change):
+        """Wait for .desktop changes, debounce them, then refresh the index"""
+        try:
+            while self.running:
+                # Time out regularly so stop() is noticed
+                if not self.handle_events(self.inotify.read_events(self.POLL_INTERVAL)):
+                    continue
+            
+                # Package installs touch many files at once; wait until they settle
+                while self.running:
+                    events = self.inotify.read_events(self.DEBOUNCE)
+                    if not events:
+                        break
+                    self.handle_events(events)
+            
+                if self.running and self.refresh():
+                    on_change()
+        except OSError as e:
+            print(f"Desktop file watching stopped: {e}")
+        finally:
+            self.inotify.close()
+    
+    def stop(self):
+        """Stop watching for changes; the watch thread closes inotify within a second"""
+        self.running = False
+
+
+class IconResolver:
+    """Freedesktop icon-theme lookup backed by a persistent name index"""
+    
+    BASE_DIRS = (
+        str(Path.home() / '.local/share/icons'),
+        str(Path.home() / '.icons'),
+        str(Path.home() / '.local/share/flatpak/exports/share/icons'),
+        '/var/lib/flatpak/exports/share/icons',
+        '/usr/local/share/icons',
+        '/usr/share/icons',
+    )
+    PIXMAPS_DIR = '/usr/share/pixmaps'
+    FORMATS = ('.png', '.svg', '.xpm')
+    VERSION = 1
+    
+    # Size directories are named like '48x48', '48x48@2' or just '48'
+    SIZE_DIR = re.compile(r'^(\d+)(?:x\d+)?(?:@(\d+)x?)?$')
+    SCALABLE = 0
+    # Rasterised SVGs not used for this long are deleted when the index changes
+    RASTER_MAX_AGE = 30 * 86400
+    
+    def __init__(self, theme=None):
+        self.theme = theme or self.detect_theme()
+        self.index_path = CACHE_DIR / 'icon-index.json'
+        self.raster_dir = CACHE_DIR / 'icons'
+        self.themes = None
+        self.chain = []
+        self.lock = threading.Lock()
+        self.can_rasterise = cairosvg is not None or shutil.which('rsvg-convert') is not None
+        # Index builds and SVG rendering are slow, so keep them off the Tk thread
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='icons')
+    
+    def prewarm(self):
+        """Load the index in the background before the first icon is needed"""
+        self.executor.submit(self.index)
+    
+    def index(self):
+        """Return the loaded index, loading it on first use"""
+        with self.lock:
+            if self.themes is None:
+                self.themes = self.load_index()
+            return self.themes
+    
+    def detect_theme(self):
+        """Return the desktop's icon theme name from the GTK settings, if set"""
+        settings = Path.home() / '.config/gtk-3.0/settings.ini'
+        try:
+            for line in settings.read_text().splitlines():
+                key, _, value = line.partition('=')
+                if key.strip() == 'gtk-icon-theme-name' and value.strip():
+                    return value.strip()
+        except OSError:
+            pass
+        return 'hicolor'
+    
+    def theme_dirs(self, theme):
+        """Return the existing directories that make up a theme"""
+        return [os.path.join(base, theme) for base in self.BASE_DIRS
+                if os.path.isdir(os.path.join(base, theme))]
+    
+    def theme_chain(self):
+        """Return the active theme followed by its inherited themes and hicolor"""
+        chain = []
+        pending = [self.theme]
+        while pending:
+            theme = pending.pop(0)
+            if theme in chain:
+                continue
+            chain.append(theme)
+            for directory in self.theme_dirs(theme):
+                index_theme = os.path.join(directory, 'index.theme')
+                try:
+                    with open(index_theme, 'r', errors='replace') as f:
+                        for line in f:
+                            if line.startswith('Inherits='):
+                                pending.extend(t.strip() for t in line[9:].split(',') if t.strip())
+                                break
+                except OSError:
+                    continue
+                break
+        if 'hicolor' not in chain:
+            chain.append('hicolor')
+        return chain
+    
+    def scan_theme(self, theme):
+        """Walk a theme and return (icons, stamps) for its index entry"""
+        icons = {}
+        stamps = {}
+        for theme_dir in self.theme_dirs(theme):
+            for root, _, files in os.walk(theme_dir):
+                try:
+                    stamps[root] = os.stat(root).st_mtime_ns
+                except OSError:
+                    continue
+                
+                size, scale = None, 1
+                for part in Path(root).relative_to(theme_dir).parts:
+                    if part == 'scalable':
+                        size = self.SCALABLE
+                        continue
+                    match = self.SIZE_DIR.match(part)
+                    if match:
+                        size = int(match.group(1))
+                        scale = int(match.group(2) or 1)
+                if size is None:
+                    continue
+                
+                for filename in files:
+                    name, ext = os.path.splitext(filename)
+                    if ext in self.FORMATS:
+                        icons.setdefault(name, []).append(
+                            [size, scale, ext[1:], os.path.join(root, filename)]
+                        )
+        return icons, stamps
+    
+    def scan_pixmaps(self):
+        """Index the flat pixmaps directory used as a last resort"""
+        icons = {}
+        stamps = {}
+        try:
+            stamps[self.PIXMAPS_DIR] = os.stat(self.PIXMAPS_DIR).st_mtime_ns
+            for filename in os.listdir(self.PIXMAPS_DIR):
+                name, ext = os.path.splitext(filename)
+                if ext in self.FORMATS:
+                    icons.setdefault(name, []).append(
+                        [self.SCALABLE if ext == '.svg' else 0, 1, ext[1:],
+                         os.path.join(self.PIXMAPS_DIR, filename)]
+                    )
+        except OSError:
+            pass
+        return icons, stamps
+    
+    def scan(self, theme):
+        """Return a fresh index entry for a theme or the pixmaps directory"""
+        if theme == self.PIXMAPS_DIR:
+            icons, stamps = self.scan_pixmaps()
+        else:
+            icons, stamps = self.scan_theme(theme)
+        return {'dirs': self.source_dirs(theme), 'stamps': stamps, 'icons': icons}
+    
+    def source_dirs(self, theme):
+        """Return the directories an index entry was built from"""
+        if theme == self.PIXMAPS_DIR:
+            return [theme] if os.path.isdir(theme) else []
+        return self.theme_dirs(theme)
+    
+    def is_current(self, entry, theme):
+        """Return True if no directory of a cached theme has changed"""
+        if entry.get('dirs') != self.source_dirs(theme):
+            return False
+        for path, mtime in entry['stamps'].items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def load_index(self):
+        """Load the persisted index and rescan only themes whose directories changed"""
+        cached = {}
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                cached = data['themes']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        self.chain = self.theme_chain()
+        themes = {}
+        changed = False
+        for theme in self.chain + [self.PIXMAPS_DIR]:
+            entry = cached.get(theme)
+            if entry is None or not self.is_current(entry, theme):
+                entry = self.scan(theme)
+                changed = True
+            themes[theme] = entry
+        
+        if changed:
+            # Keep other cached themes so switching back does not rescan
+            for theme, entry in cached.items():
+                themes.setdefault(theme, entry)
+            self.save_index(themes)
+            self.prune_rasters()
+        return themes
+    
+    def best_match(self, candidates, size):
+        """Pick the candidate closest to size, preferring exact bitmaps then SVG"""
+        def score(candidate):
+            icon_size, scale, fmt, _ = candidate
+            if fmt == 'svg' and not self.can_rasterise:
+                return (3, 0)
+            pixels = icon_size * scale
+            if pixels == size and fmt != 'svg':
+                return (0, 0)
+            if fmt == 'svg':
+                return (1, 0)
+            # Larger bitmaps scale down better than smaller ones scale up
+            return (2, abs(pixels - size) if pixels >= size else 10000 + size - pixels)
+        return min(candidates, key=score)
+    
+    def resolve(self, name, size):
+        """Return a raster file path for an icon name, or None"""
+        themes = self.index()
+        
+        # Strip extensions that some .desktop files include in Icon=
+        name = os.path.splitext(name)[0] if name.endswith(self.FORMATS) else name
+        for theme in self.chain + [self.PIXMAPS_DIR]:
+            candidates = themes.get(theme, {}).get('icons', {}).get(name)
+            if candidates:
+                icon_size, scale, fmt, path = self.best_match(candidates, size)
+                if fmt != 'svg':
+                    return path
+                if self.can_rasterise:
+                    return self.rasterise(path, size)
+        return None
+    
+    def rasterise(self, svg_path, size):
+        """Render an SVG to a cached PNG once and return the PNG path"""
+        try:
+            mtime = os.stat(svg_path).st_mtime_ns
+        except OSError:
+            return None
+        key = hashlib.sha1(f"{svg_path}:{size}".encode()).hexdigest()[:16]
+        png_path = self.raster_dir / f"{key}-{mtime}.png"
+        try:
+            # Touch on use so prune_rasters() only drops icons nobody shows
+            os.utime(png_path)
+            return str(png_path)
+        except OSError:
+            pass
+        
+        try:
+            self.raster_dir.mkdir(parents=True, exist_ok=True)
+            # Drop renders of older versions of this SVG
+            for stale in self.raster_dir.glob(f"{key}-*.png"):
+                stale.unlink(missing_ok=True)
+            if cairosvg is not None:
+                cairosvg.svg2png(url=svg_path, write_to=str(png_path),
+                                 output_width=size, output_height=size)
+            else:
+                subprocess.run(
+                    ['rsvg-convert', '-w', str(size), '-h', str(size), '-o', str(png_path), svg_path],
+                    timeout=5,
+                    capture_output=True,
+                    check=True
+                )
+            return str(png_path)
+        except Exception as e:
+            print(f"Error rasterising {svg_path}: {e}")
+            # Do not leave a partial render to be picked up next time
+            png_path.unlink(missing_ok=True)
+            return None
+    
+    def prune_rasters(self):
+        """Delete rasterised icons that have not been used recently"""
+        cutoff = time.time() - self.RASTER_MAX_AGE
+        try:
+            for png_path in self.raster_dir.glob('*.png'):
+                try:
+                    if png_path.stat().st_mtime < cutoff:
+                        png_path.unlink()
+                except OSError:
+                    continue
+        except OSError:
+            pass
+    
+    def save_index(self, themes):
+        """Persist the index atomically"""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': self.VERSION, 'themes': themes}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"Error saving icon index: {e}")
+
+
 class PsionLauncher:
     """Main launcher application"""
     
-    def __init__(self):
+    def __init__(self, dry_run=False):
         self.root = tk.Tk()
         self.config_path = Path(__file__).parent / 'config.json'
+        self.dry_run = dry_run
+        self.datetime_interval_ms = 1000
+        self.buttons = []
+        self.desktop_indexes = {}
+        self.click_latencies = deque(maxlen=100)
         self.load_config()
+        self.icon_resolver = IconResolver(theme=self.config.get('icons', {}).get('theme'))
+        self.icon_resolver.prewarm()
         self.init_ui()
     
     def load_config(self):
@@ -638,6 +2280,46 @@ class PsionLauncher:
                 "background": "#D6D9D2",
                 "text": "#2F332E"
             },
+            "storage": {
+                "mounts": ["/"],
+                "capacity_interval": 60
+            },
+            "processes": {
+                "count": 8,
+                "refresh_ms": 1000
+            },
+            "metrics": {
+                "shared_path": SHARED_METRICS_PATH,
+                "interval": 1.0,
+                "stale_after": 5
+            },
+            "icons": {
+                "theme": ""
+            },
+            "lag_monitor": {
+                "enabled": False,
+                "interval_ms": 100,
+                "threshold_ms": 250,
+                "report_interval": 60,
+                "log": "lag.log",
+                "log_max_bytes": 1048576,
+                "log_backups": 2,
+                "overlay": False
+            },
+            "soak": {
+                "hours": 4,
+                "speed": 10,
+                "click_interval_ms": 500,
+                "sample_interval": 30,
+                "warmup": 120,
+                "budget": {
+                    "rss_mb": 16,
+                    "threads": 2,
+                    "canvas_items": 0,
+                    "widgets": 0
+                },
+                "log": "soak.log"
+            },
             "applications": [
                 {
                     "name": "Warp",
@@ -732,8 +2414,21 @@ class PsionLauncher:
         # Protocol for window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Status bar at top
-        self.status_bar = StatusBar(self.root)
+        # Storage collector shared by the status bar and System window
+        storage_config = self.config.get('storage', {})
+        self.storage_monitor = StorageMonitor(
+            mounts=storage_config.get('mounts', ['/']),
+            capacity_interval=storage_config.get('capacity_interval', 60)
+        )
+        
+        # Status bar at top, reading from the metrics producer when it is running
+        metrics_config = self.config.get('metrics', {})
+        self.status_bar = StatusBar(
+            self.root,
+            storage_monitor=self.storage_monitor,
+            shared_metrics=SharedMetrics(metrics_config.get('shared_path', SHARED_METRICS_PATH)),
+            stale_after=metrics_config.get('stale_after', 5)
+        )
         self.status_bar.pack(fill=tk.X, side=tk.TOP)
         
         # Top header frame with title, date/time, and clock
@@ -778,33 +2473,99 @@ class PsionLauncher:
         content_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(10, 30))
         
         # Left side: Grid of main application buttons
-        grid_frame = tk.Frame(content_frame, bg=self.config['theme']['background'])
-        grid_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 30))
+        self.grid_frame = tk.Frame(content_frame, bg=self.config['theme']['background'])
+        self.grid_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 30))
+        self.grid_buttons = []
+        self.grid_rows = 0
+        self.build_app_grid()
+        
+        # Right side: Vertical stack of wide buttons
+        side_frame = tk.Frame(content_frame, bg=self.config['theme']['background'])
+        side_frame.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        side_buttons = self.config.get('side_buttons', [])
+        for side_btn_data in side_buttons:
+            btn = LauncherButton(side_frame, side_btn_data, wide=True, launcher=self)
+            self.buttons.append(btn)
+            btn.pack(pady=8, fill=tk.X)
+    
+        # Event-loop lag watchdog
+        lag_config = self.config.get('lag_monitor', {})
+        self.lag_monitor = None
+        if lag_config.get('enabled', False):
+            try:
+                self.lag_monitor = LagMonitor(
+                    self.root,
+                    interval_ms=lag_config.get('interval_ms', 100),
+                    threshold_ms=lag_config.get('threshold_ms', 250),
+                    log_path=lag_config.get('log', 'lag.log'),
+                    overlay=lag_config.get('overlay', False),
+                    report_interval=lag_config.get('report_interval', 60),
+                    log_max_bytes=lag_config.get('log_max_bytes', 1024 * 1024),
+                    log_backups=lag_config.get('log_backups', 2)
+                )
+            except OSError as e:
+                print(f"Lag monitor disabled: {e}")
+    
+    def resolve_applications(self):
+        """Expand 'discover' entries in the applications list into discovered apps"""
+        apps = []
+        for app in self.config['applications']:
+            if app.get('type') != 'discover':
+                apps.append(app)
+                continue
+            
+            dirs = tuple(app.get('dirs', DesktopIndex.DEFAULT_DIRS))
+            index = self.desktop_indexes.get(dirs)
+            if index is None:
+                index = DesktopIndex(dirs)
+                index.refresh()
+                index.watch(lambda: self.root.after(0, self.build_app_grid))
+                self.desktop_indexes[dirs] = index
+            
+            exclude = set(app.get('exclude', []))
+            discovered = [d for d in index.apps(app.get('desktops')) if d['name'] not in exclude]
+            
+            # The grid does not scroll, so by default only fill the free cells
+            limit = app.get('limit', self.free_grid_cells())
+            apps.extend(discovered[:limit])
+        return apps
+    
+    def free_grid_cells(self):
+        """Return grid cells not taken by the hand-written application entries"""
+        grid = self.config['grid']
+        fixed = sum(1 for app in self.config['applications'] if app.get('type') != 'discover')
+        return max(0, grid['columns'] * grid.get('rows', 2) - fixed)
+    
+    def build_app_grid(self):
+        """(Re)build the grid of main application buttons"""
+        for btn in self.grid_buttons:
+            self.buttons.remove(btn)
+            btn.destroy()
+        self.grid_buttons = []
         
-        apps = self.config['applications']
+        apps = self.resolve_applications()
         cols = self.config['grid']['columns']
         
         for i, app in enumerate(apps):
             row = i // cols
             col = i % cols
             
-            btn = LauncherButton(grid_frame, app)
+            btn = LauncherButton(self.grid_frame, app, launcher=self)
+            self.buttons.append(btn)
+            self.grid_buttons.append(btn)
             btn.grid(row=row, column=col, padx=8, pady=8, sticky='nsew')
         
         # Configure grid to fill space
+        rows = (len(apps) + cols - 1) // cols
         for i in range(cols):
-            grid_frame.grid_columnconfigure(i, weight=1, uniform='app_cols')
-        for i in range((len(apps) + cols - 1) // cols):
-            grid_frame.grid_rowconfigure(i, weight=1, uniform='app_rows')
-        
-        # Right side: Vertical stack of wide buttons
-        side_frame = tk.Frame(content_frame, bg=self.config['theme']['background'])
-        side_frame.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        side_buttons = self.config.get('side_buttons', [])
-        for side_btn_data in side_buttons:
-            btn = LauncherButton(side_frame, side_btn_data, wide=True)
-            btn.pack(pady=8, fill=tk.X)
+            self.grid_frame.grid_columnconfigure(i, weight=1, uniform='app_cols')
+        for i in range(rows):
+            self.grid_frame.grid_rowconfigure(i, weight=1, uniform='app_rows')
+        # Release rows left over from a previous, longer list
+        for i in range(rows, self.grid_rows):
+            self.grid_frame.grid_rowconfigure(i, weight=0, uniform='')
+        self.grid_rows = rows
     
     def update_datetime(self):
         """Update the date/time label"""
@@ -812,13 +2573,18 @@ class PsionLauncher:
         date_str = now.strftime("%A, %B %d, %Y")
         time_str = now.strftime("%I:%M:%S %p")
         self.datetime_label.config(text=f"{date_str}  |  {time_str}")
-        self.root.after(1000, self.update_datetime)
+        self.root.after(self.datetime_interval_ms, self.update_datetime)
     
     def on_close(self):
         """Handle application close"""
         self.status_bar.stop()
         if hasattr(self, 'clock'):
             self.clock.stop()
+        if self.lag_monitor:
+            self.lag_monitor.stop()
+        for index in self.desktop_indexes.values():
+            index.stop()
+        self.icon_resolver.executor.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
         self.root.destroy()
     
@@ -827,10 +2593,212 @@ class PsionLauncher:
         self.root.mainloop()
 
 
+class SoakTest:
+    """Drive the launcher for hours and fail if resource usage keeps growing"""
+    
+    def __init__(self, launcher, hours=None, speed=None):
+        self.launcher = launcher
+        self.root = launcher.root
+        
+        soak_config = launcher.config.get('soak', {})
+        self.hours = hours if hours is not None else soak_config.get('hours', 4)
+        self.speed = speed if speed is not None else soak_config.get('speed', 10)
+        self.click_interval_ms = soak_config.get('click_interval_ms', 500)
+        self.sample_interval = soak_config.get('sample_interval', 30)
+        self.warmup = soak_config.get('warmup', 120)
+        self.budget = {
+            'rss_mb': 16,
+            'threads': 2,
+            'canvas_items': 0,
+            'widgets': 0
+        }
+        self.budget.update(soak_config.get('budget', {}))
+        self.log_path = CACHE_DIR / soak_config.get('log', 'soak.log')
+        
+        self.process = psutil.Process()
+        self.click_index = 0
+        self.clicks = 0
+        self.baseline = None
+        self.baseline_snapshot = None
+        self.baseline_time = None
+        self.passed = False
+        self.started = None
+        self.log_file = None
+    
+    def start(self):
+        """Accelerate the launcher timers and schedule clicks and sampling"""
+        tracemalloc.start()
+        self.started = time.monotonic()
+        
+        self.launcher.clock.interval = 1.0 / self.speed
+        self.launcher.status_bar.interval = 2.0 / self.speed
+        self.launcher.datetime_interval_ms = max(1, int(1000 / self.speed))
+        
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_file = open(self.log_path, 'w')
+        self.log({'event': 'start', 'hours': self.hours, 'speed': self.speed,
+                  'budget': self.budget})
+        
+        self.root.after(self.click_interval_ms, self.click_next)
+        self.root.after(int(self.warmup * 1000), self.take_baseline)
+        self.root.after(int(self.hours * 3600 * 1000), self.finish)
+    
+    def log(self, record):
+        """Append a JSON record to the soak log"""
+        record['elapsed'] = round(time.monotonic() - self.started, 1)
+        self.log_file.write(json.dumps(record) + "\n")
+        self.log_file.flush()
+    
+    def click_next(self):
+        """Simulate a click on the next launcher button"""
+        buttons = self.launcher.buttons
+        if buttons:
+            button = buttons[self.click_index % len(buttons)]
+            self.click_index += 1
+            self.clicks += 1
+            button.on_click(None)
+            if button.app_data.get('type') == 'system_info':
+                self.root.after(self.click_interval_ms // 2, self.close_toplevels)
+        self.root.after(self.click_interval_ms, self.click_next)
+    
+    def close_toplevels(self):
+        """Close any windows opened by simulated clicks"""
+        for child in self.root.winfo_children():
+            if isinstance(child, tk.Toplevel):
+                child.destroy()
+    
+    def count_widgets(self, widget):
+        """Count a widget and all of its descendants"""
+        return 1 + sum(self.count_widgets(child) for child in widget.winfo_children())
+    
+    def measure(self):
+        """Return the current resource figures tracked by the soak test"""
+        # A System window still open from the last click would count as growth
+        self.close_toplevels()
+        return {
+            'rss_mb': self.process.memory_info().rss / (1024 * 1024),
+            'threads': threading.active_count(),
+            'canvas_items': len(self.launcher.clock.find_all()),
+            # Item ids only ever increase, so the highest id shows redraw churn
+            'canvas_max_id': max(self.launcher.clock.find_all(), default=0),
+            'widgets': self.count_widgets(self.root)
+        }
+    
+    def canvas_id_rate(self, current):
+        """Return canvas item ids allocated per second since the baseline"""
+        elapsed = time.monotonic() - self.baseline_time
+        if elapsed <= 0:
+            return 0.0
+        return round((current['canvas_max_id'] - self.baseline['canvas_max_id']) / elapsed, 1)
+    
+    def take_baseline(self):
+        """Record the post-warmup baseline and start periodic sampling"""
+        self.baseline = self.measure()
+        self.baseline_time = time.monotonic()
+        self.baseline_snapshot = tracemalloc.take_snapshot()
+        self.log({'event': 'baseline', **self.baseline})
+        self.root.after(int(self.sample_interval * 1000), self.sample)
+    
+    def top_allocators(self, limit=5):
+        """Return the source lines whose allocations grew most since the baseline"""
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.baseline_snapshot, 'lineno')
+        return [
+            {'where': str(stat.traceback), 'size_diff_kb': round(stat.size_diff / 1024, 1),
+             'count_diff': stat.count_diff}
+            for stat in stats[:limit] if stat.size_diff > 0
+        ]
+    
+    def growth(self, current):
+        """Return growth of each tracked figure relative to the baseline"""
+        return {key: current[key] - self.baseline[key] for key in self.budget}
+    
+    def sample(self):
+        """Log one sample of resource usage and allocation growth"""
+        current = self.measure()
+        self.log({
+            'event': 'sample',
+            'clicks': self.clicks,
+            'click_latency_ms_max': round(max(self.launcher.click_latencies, default=0) * 1000, 2),
+            **current,
+            'canvas_ids_per_sec': self.canvas_id_rate(current),
+            'growth': self.growth(current),
+            'top_allocators': self.top_allocators()
+        })
+        self.root.after(int(self.sample_interval * 1000), self.sample)
+    
+    def finish(self):
+        """Compare final usage against the budget, report and close the launcher"""
+        if self.baseline is None:
+            print("Soak test ended before warmup completed", file=sys.stderr)
+            self.passed = False
+        else:
+            current = self.measure()
+            growth = self.growth(current)
+            exceeded = {key: value for key, value in growth.items() if value > self.budget[key]}
+            self.passed = not exceeded
+            self.log({
+                'event': 'finish',
+                'passed': self.passed,
+                'clicks': self.clicks,
+                **current,
+                'canvas_ids_per_sec': self.canvas_id_rate(current),
+                'growth': growth,
+                'exceeded': exceeded,
+                'top_allocators': self.top_allocators(10)
+            })
+            
+            for key, value in growth.items():
+                status = "FAIL" if key in exceeded else "ok"
+                print(f"{key:14s}: {value:+.1f} (budget {self.budget[key]}) {status}")
+            print(f"Soak test {'passed' if self.passed else 'FAILED'} - log: {self.log_path}")
+        
+        self.log_file.close()
+        tracemalloc.stop()
+        self.launcher.on_close()
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Psion-inspired launcher for Raspberry Pi")
+    parser.add_argument('--soak', action='store_true',
+                        help="run the soak test with simulated clicks and exit non-zero on leaks")
+    parser.add_argument('--hours', type=float, help="soak test duration in hours")
+    parser.add_argument('--speed', type=float, help="soak test tick-rate multiplier")
+    parser.add_argument('--metrics-daemon', action='store_true',
+                        help="run the shared metrics producer instead of the launcher")
+    parser.add_argument('--metrics-check', action='store_true',
+                        help="check the shared metrics record layout round-trips, then exit")
+    args = parser.parse_args()
+    
+    if args.metrics_check:
+        try:
+            SharedMetrics.self_check()
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        print("Shared metrics layout OK")
+        return
+    
+    if args.metrics_daemon:
+        config_path = Path(__file__).parent / 'config.json'
+        config = json.loads(config_path.read_text()) if config_path.exists() else {}
+        try:
+            MetricsProducer(config).run()
+        except KeyboardInterrupt:
+            pass
+        except RuntimeError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        return
+    
     try:
-        launcher = PsionLauncher()
+        launcher = PsionLauncher(dry_run=args.soak)
+        if args.soak:
+            soak = SoakTest(launcher, hours=args.hours, speed=args.speed)
+            soak.start()
         launcher.run()
+        if args.soak:
+            sys.exit(0 if soak.passed else 1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)